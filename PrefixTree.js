@@ -34,21 +34,21 @@ export default class PrefixTree {
     let i = 0;
     for (const c of position) {
       // Go deeper into nodes as far as possible.
-      if (node.has(c)) {
-        node = node.get(c);
-        i++;
-      } else if (node.has('?')) {
+      // (Look up each child only once, instead of has() followed by get().)
+      let child = node.get(c);
+      if (child === undefined && node.has('?')) {
         // If a node has already been split, add the next character to it.
-        node.set(c, new Map());
-        node.get(c).set('-', []);
-        node = node.get(c);
-        i++;
-      } else {
-        break;
+        child = new Map([['-', []]]);
+        node.set(c, child);
       }
+      if (child === undefined)
+        break;
+      node = child;
+      i++;
     }
-    node.get('-').push([position.substr(i), object]);
-    if (node.get('-').length > maxNodeSize)
+    const objects = node.get('-');
+    objects.push([position.substr(i), object]);
+    if (objects.length > maxNodeSize)
       this.splitNode(node);
   }
 
@@ -64,11 +64,12 @@ export default class PrefixTree {
         continue;
       }
       const c = position.charAt(0);
-      if (!node.has(c)) {
-        node.set(c, new Map());
-        node.get(c).set('-', []);
+      let child = node.get(c);
+      if (child === undefined) {
+        child = new Map([['-', []]]);
+        node.set(c, child);
       }
-      node.get(c).get('-').push([position.substr(1), object]);
+      child.get('-').push([position.substr(1), object]);
     }
     node.set('-', objectsEndingAtNode);
     node.set('?', true);
@@ -82,15 +83,16 @@ export default class PrefixTree {
    */
   get(value) {
     let node = this.root_;
-    let result = node.get('-');
+    const result = [];
+    for (const [_position, object] of node.get('-'))
+      result.push(object);
     for (const c of value) {
-      if (node.has(c)) {
-        node = node.get(c);
-        result = result.concat(node.get('-'));
-      } else {
+      node = node.get(c);
+      if (node === undefined)
         break;
-      }
+      for (const [_position, object] of node.get('-'))
+        result.push(object);
     }
-    return result.map(([_position, object]) => object);
+    return result;
   }
 }
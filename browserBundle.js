@@ -22,6 +22,39 @@ const boundariesRegex = /[-\s\u2013\u2014_.,:;!|=+*\\/"()&#%@$?]/;
  * @type {RegExp}
  */
 const newlineRegex = /\r\n|[\n\v\f\r\x85\u2028\u2029]/;
+/**
+ * The same as `boundariesRegex`, but with global matching, for replace().
+ * @type {RegExp}
+ */
+const globalBoundariesRegex = new RegExp(boundariesRegex, 'g');
+
+/**
+ * Replacements for foreign letters that unicode normalization doesn't handle,
+ * see `normalize`.
+ * @type {Object<string, string>}
+ */
+const foreignLetters = {
+  '\u00DF': 'ss', '\u1E9E': 'SS', // scharfes S
+  '\u0111': 'd', '\u0110': 'D', // crossed D
+  '\u00F0': 'd', '\u00D0': 'D', // eth
+  '\u00FE': 'th', '\u00DE': 'TH', // thorn
+  '\u0127': 'h', '\u0126': 'H', // H-bar
+  '\u0142': 'l', '\u0141': 'L', // L with stroke
+  '\u0153': 'oe', '\u0152': 'Oe', // oe ligature
+  '\u00E6': 'ae', '\u00C6': 'Ae', // ae ligature
+  '\u0131': 'i', // dotless i
+  '\u00F8': 'o', '\u00D8': 'O', // o with stroke
+  // Catalan middle dot, double prime (weirdly used for slavic langs),
+  // unicode replacement character (for some mis-utf'd Turkish).
+  '\u00B7': '', '\u02BA': '', '\uFFFD': '',
+};
+/**
+ * Matches any key of `foreignLetters`, so that they are all replaced in one
+ * pass. It has global matching, so only use it in replace().
+ * @type {RegExp}
+ */
+const foreignLettersRegex = new RegExp(
+    '[' + Object.keys(foreignLetters).join('') + ']', 'g');
 
 /**
  * Remove diacritics and try to replace foreign letters with `[a-zA-Z].
@@ -31,20 +64,11 @@ const newlineRegex = /\r\n|[\n\v\f\r\x85\u2028\u2029]/;
  * @return {string}
  */
 function normalize(s) {
+  // Nothing to do for plain ASCII, which is the most common case by far.
+  if (/^[\x00-\x7F]*$/.test(s))
+    return s;
   return s
-      .replace(/\u00DF/g, 'ss').replace(/\u1E9E/g, 'SS') // scharfes S
-      .replace(/\u0111/g, 'd').replace(/\u0110/g, 'D') // crossed D
-      .replace(/\u00F0/g, 'd').replace(/\u00D0/g, 'D') // eth
-      .replace(/\u00FE/g, 'th').replace(/\u00DE/g, 'TH') // thorn
-      .replace(/\u0127/g, 'h').replace(/\u0126/g, 'H') // H-bar
-      .replace(/\u0142/g, 'l').replace(/\u0141/g, 'L') // L with stroke
-      .replace(/\u0153/g, 'oe').replace(/\u0152/g, 'Oe') // oe ligature
-      .replace(/\u00E6/g, 'ae').replace(/\u00C6/g, 'Ae') // ae ligature
-      .replace(/\u0131/g, 'i') // dotless i
-      .replace(/\u00F8/g, 'o').replace(/\u00D8/g, 'O') // o with stroke
-  // Catalan middle dot, double prime (weirdly used for slavic langs),
-  // unicode replacement character (for some mis-utf'd Turkish).
-      .replace(/[\u00B7\u02BA\uFFFD]/g, '')
+      .replace(foreignLettersRegex, (c) => foreignLetters[c])
   // Most diacritics are handled by this standard unicode normalization:
   // it decomposes characters into simpler characters plus modifiers,
   // and throws out the modifiers.
@@ -61,10 +85,34 @@ function normalize(s) {
 function promiscuouslyNormalize(s) {
   return normalize(s)
       .toLowerCase()
-      .replace(new RegExp(boundariesRegex, 'g'), ' ')
-      .replace(/\s+/gu, ' ').replace(/^\s/gu, '').replace(/\s$/gu, '')
+      .replace(globalBoundariesRegex, ' ')
+      .replace(/\s+/gu, ' ').trim()
       .replace(/[^a-z\ ]/g, ' ')
-      .replace(/kh/g, '').replace(/h/g, '');
+      .replace(/k?h/g, ''); // Remove all 'kh' and then all 'h'.
+}
+
+/**
+ * Maximum number of strings remembered by `fold`.
+ */
+const maxFoldCacheSize = 100000;
+/** @type {Map<string, string>} Cache of `fold` results. */
+const foldCache = new Map();
+
+/**
+ * Returns `normalize(s).toLowerCase()`, memoized: `cEquiv` is called with the
+ * same few single characters (or pairs) over and over.
+ * @param {string} s
+ * @return {string}
+ */
+function fold(s) {
+  let result = foldCache.get(s);
+  if (result === undefined) {
+    result = normalize(s).toLowerCase();
+    if (foldCache.size >= maxFoldCacheSize)
+      foldCache.clear();
+    foldCache.set(s, result);
+  }
+  return result;
 }
 
 /**
@@ -79,7 +127,9 @@ function cEquiv(s, t) {
   // TODO perhaps we could use instead the following more standard collator?
   //    c = new Intl.Collator('en-u', {usage:'search', sensitivity:'base'});
   //    return c.compare(s,t);
-  return (normalize(s).toLowerCase() == normalize(t).toLowerCase());
+  if (s === t)
+    return true;
+  return (fold(s) == fold(t));
 }
 
 /**
@@ -87,63 +137,78 @@ function cEquiv(s, t) {
  * E.g., for `s='dæl·lete'`, `t='daell'` the output should be
  * `[['d','æ','l','·','l'] , ['d','ae','l','','l']]`.
  * @param {string} s
- * @param {string} t
+ * @param {(string|Array<string>)} t - Possibly already split into characters
+ *  (by `Array.from`), when matching the same `t` many times.
  * @return {Array<Array<string>>} Pair of equal-length Arrays of consecutive
  *  characters in `s` and `t` that were found to be equivalent.
  */
 function getCollatingMatch(s, t) {
-  const ss = Array.from(s);
-  const tt = Array.from(t);
+  // Split `s` into characters lazily (like `Array.from`, by code points):
+  // matches usually fail or end within a few characters, while `s` is often
+  // the whole rest of a title.
+  const ss = [];
+  let pos = 0;
+  const splitUpTo = (n) => {
+    while (ss.length < n && pos < s.length) {
+      const length = (s.codePointAt(pos) > 0xFFFF) ? 2 : 1;
+      ss.push(s.substr(pos, length));
+      pos += length;
+    }
+  };
+  const tt = (t instanceof Array) ? t : Array.from(t);
   let i = 0;
   let j = 0;
   const result = [[], []];
 
   while (j < tt.length) {
+    splitUpTo(i + 2);
+    // Read the current characters (and pairs of characters) only once.
+    const c = ss[i];
+    const d = tt[j];
+    const cc = (i + 1 < ss.length) ? c + ss[i+1] : null;
+    const dd = (j + 1 < tt.length) ? d + tt[j+1] : null;
     if (i >= ss.length) {
-      if (cEquiv('', tt[j])) {
+      if (cEquiv('', d)) {
         result[0].push('');
-        result[1].push(tt[j]);
+        result[1].push(d);
         j++;
       } else {
         return false; // `ss` is too short to match `tt`.
       }
-    } else if (i + 1 < ss.length && j + 1 < tt.length
-               && cEquiv(ss[i]+ss[i+1], tt[j]+tt[j+1])) {
-      result[0].push(ss[i]);
-      result[1].push(tt[j]);
+    } else if (cc !== null && dd !== null && cEquiv(cc, dd)) {
+      result[0].push(c);
+      result[1].push(d);
       i++;
       j++;
-    } else if (j + 1 < tt.length
-               && cEquiv(ss[i], tt[j]+tt[j+1]) && !cEquiv(tt[j+1], '')) {
-      if (cEquiv('', tt[j])) {
+    } else if (dd !== null && cEquiv(c, dd) && !cEquiv(tt[j+1], '')) {
+      if (cEquiv('', d)) {
         result[0].push('');
-        result[1].push(tt[j]);
+        result[1].push(d);
         j++;
       } else {
-        result[0].push(ss[i]);
-        result[1].push(tt[j]+tt[j+1]);
+        result[0].push(c);
+        result[1].push(dd);
         i++;
         j += 2;
       }
-    } else if (i + 1 < ss.length
-               && cEquiv(ss[i] + ss[i+1], tt[j]) && !cEquiv(ss[i+1], '')) {
-      if (cEquiv(ss[i], '')) {
-        result[0].push(ss[i]);
+    } else if (cc !== null && cEquiv(cc, d) && !cEquiv(ss[i+1], '')) {
+      if (cEquiv(c, '')) {
+        result[0].push(c);
         result[1].push('');
         i++;
       } else {
-        result[0].push(ss[i]+ss[i+1]);
-        result[1].push(tt[j]);
+        result[0].push(cc);
+        result[1].push(d);
         i += 2;
         j++;
       }
-    } else if (cEquiv(ss[i], tt[j])) {
-      result[0].push(ss[i]);
-      result[1].push(tt[j]);
+    } else if (cEquiv(c, d)) {
+      result[0].push(c);
+      result[1].push(d);
       i++;
       j++;
-    } else if (cEquiv(ss[i], '')) {
-      result[0].push(ss[i]);
+    } else if (cEquiv(c, '')) {
+      result[0].push(c);
       result[1].push('');
       i++;
     } else {
@@ -195,21 +260,21 @@ class PrefixTree {
     let i = 0;
     for (const c of position) {
       // Go deeper into nodes as far as possible.
-      if (node.has(c)) {
-        node = node.get(c);
-        i++;
-      } else if (node.has('?')) {
+      // (Look up each child only once, instead of has() followed by get().)
+      let child = node.get(c);
+      if (child === undefined && node.has('?')) {
         // If a node has already been split, add the next character to it.
-        node.set(c, new Map());
-        node.get(c).set('-', []);
-        node = node.get(c);
-        i++;
-      } else {
-        break;
+        child = new Map([['-', []]]);
+        node.set(c, child);
       }
+      if (child === undefined)
+        break;
+      node = child;
+      i++;
     }
-    node.get('-').push([position.substr(i), object]);
-    if (node.get('-').length > maxNodeSize)
+    const objects = node.get('-');
+    objects.push([position.substr(i), object]);
+    if (objects.length > maxNodeSize)
       this.splitNode(node);
   }
 
@@ -225,11 +290,12 @@ class PrefixTree {
         continue;
       }
       const c = position.charAt(0);
-      if (!node.has(c)) {
-        node.set(c, new Map());
-        node.get(c).set('-', []);
+      let child = node.get(c);
+      if (child === undefined) {
+        child = new Map([['-', []]]);
+        node.set(c, child);
       }
-      node.get(c).get('-').push([position.substr(1), object]);
+      child.get('-').push([position.substr(1), object]);
     }
     node.set('-', objectsEndingAtNode);
     node.set('?', true);
@@ -243,16 +309,17 @@ class PrefixTree {
    */
   get(value) {
     let node = this.root_;
-    let result = node.get('-');
+    const result = [];
+    for (const [_position, object] of node.get('-'))
+      result.push(object);
     for (const c of value) {
-      if (node.has(c)) {
-        node = node.get(c);
-        result = result.concat(node.get('-'));
-      } else {
+      node = node.get(c);
+      if (node === undefined)
         break;
-      }
+      for (const [_position, object] of node.get('-'))
+        result.push(object);
     }
-    return result.map(([_position, object]) => object);
+    return result;
   }
 }
 
@@ -263,6 +330,74 @@ class PrefixTree {
  * publications according to the ISO-4 standard. It also provides a way to list
  * matching patterns from the LTWA (List of Title Word Abbreviations).
  */
+/**
+ * Flection endings accepted after a pattern with no ending dash (like -s,
+ * -ian), followed by a boundary. It is sticky, so that it can be matched
+ * at a given position without taking a substring: set lastIndex before exec().
+ * @type {RegExp}
+ */
+const flectionEndingRegex = new RegExp('([iaesn\'’]{0,3})' +
+    '($|' + boundariesRegex.source + ')', 'uy');
+/**
+ * Generic terms separating dependent titles, if followed by single letter A-Z,
+ * roman numeral, or digit. It has global matching, so only use it in replace().
+ * @type {RegExp}
+ */
+const dependentTitleRegex = new RegExp(
+    '(Series|Serie|Ser|Part|Section|Sect|Sec|Série)[,.]?\\s*([A-Z]|[0-9IVXivx]+)'
+    + '(' + boundariesRegex.source + '|$)', 'gu');
+/**
+ * French articles "l'", "d'" (which may be followed by whatever).
+ * It has global matching, so only use it in replace().
+ * @type {RegExp}
+ */
+const elidedArticlesRegex = new RegExp('((^|' +
+    boundariesRegex.source + '))(l|L|d|D|dell|nell)(\'|’)', 'gu');
+/**
+ * Matches any string with at least two words.
+ * @type {RegExp}
+ */
+const multipleWordsRegex = new RegExp(
+    '.' + boundariesRegex.source + '.', 'u');
+/**
+ * This is the same as collation.boundariesRegex, except that we don't
+ * consider +&?' as boundaries (they are part of initialisms like A&A
+ * or words like Baha'i).
+ * @type {RegExp}
+ */
+const titleBoundariesRegex = /[-\s\u2013\u2014_.,:;!|=*\\/"()#%@$]/;
+/**
+ * Regex source for a title boundary before a short word, with one
+ * parenthesised group to keep, see `removeShortWords`.
+ * @type {string}
+ */
+const shortWordBeforeSource = '(' + titleBoundariesRegex.source + ')';
+/**
+ * The same as `shortWordBeforeSource`, but also allowing the beginning.
+ * @type {string}
+ */
+const shortWordBeforeOrStartSource =
+    '(^|' + titleBoundariesRegex.source + ')';
+/**
+ * A disambiguation comment in parentheses, included in some LTWA patterns.
+ * @type {RegExp}
+ */
+const disambiguationRegex = /\(.*\)/;
+/**
+ * LTWA replacements meaning 'not abbreviated' (normalized to '–').
+ * @type {Set<string>}
+ */
+const notAbbreviatedReplacements = new Set(['n.a.', 'n. a.', 'n.a']);
+/**
+ * Articles, which (as opposed to other short words) are removed from the
+ * beginning also, and are not preserved in single word titles.
+ * @type {Array<string>}
+ */
+const articles = ['a', 'an', 'the', 'der', 'die', 'das', 'den', 'dem',
+  'des', 'le', 'la', 'les', 'el', 'il', 'lo', 'los', 'de', 'het',
+  'els', 'ses', 'es', 'gli', 'een', '\'t', '\'n'];
+
+
 /**
  * A single pattern line from the LTWA.
  * @property {string} pattern - The actual pattern from the LTWA, with dashes.
@@ -284,12 +419,13 @@ class LTWAPattern {
     this.line = line;
     let p = a[0].normalize('NFC').trim();
     // Some patterns include a disambiguation comment in parentheses, remove it.
-    p = p.replace(/\(.*\)/, '').trim();
+    if (p.includes('('))
+      p = p.replace(disambiguationRegex, '').trim();
     this.pattern = p;
     if (p.length < 3)
       throw new Error('LTWA line has too short pattern: "' + line + '"');
     this.replacement = a[1].normalize('NFC').trim();
-    if (['n.a.', 'n. a.', 'n.a'].includes(this.replacement))
+    if (notAbbreviatedReplacements.has(this.replacement))
       this.replacement = '–';
     this.languages = a[2].split(',').map(Function.prototype.call,
         String.prototype.trim);
@@ -338,25 +474,36 @@ class AbbrevIso {
      * @private The number of patterns added.
      */
     this.size_ = 0;
+    /**
+     * @private {!Map<string, {any: RegExp, each: Array<Array>}>}
+     * Compiled regexes for each list of short words, see `removeShortWords`:
+     * one finding any of the words without boundaries, and
+     * [word, hasBoundary, regex] triples for removing each.
+     */
+    this.shortWordsRegexes_ = new Map();
+    /**
+     * @private {!Array<!Map<LTWAPattern, Object>>}
+     * Patterns prepared by `preparePattern`, for `pretendDash` false and true.
+     */
+    this.preparedPatterns_ = [new Map(), new Map()];
 
     // Add all patterns from ltwa as new `LTWAPattern`s.
     if (!(ltwa instanceof Array))
       ltwa = ltwa.split(newlineRegex);
-    let firstLine = true;
-    for (const line of ltwa) {
-      if (firstLine) { // Skip header.
-        firstLine = false;
+    for (let i = 1; i < ltwa.length; i++) { // Skip header (line 0).
+      if (ltwa[i].trim().length == 0) // Skip empty lines.
         continue;
-      }
-      if (line.trim().length == 0) // Skip empty lines.
-        continue;
-      this.addPattern(new LTWAPattern(line));
+      this.addPattern(new LTWAPattern(ltwa[i]));
     }
-    // Trim all shortWords.
+    // Trim all shortWords (and skip empty ones) in one pass.
     if (!(shortWords instanceof Array))
       shortWords = shortWords.split(newlineRegex);
-    shortWords = shortWords.map((s) => s.trim());
-    this.shortWords_ = shortWords.filter((s) => s.length > 0);
+    this.shortWords_ = [];
+    for (let word of shortWords) {
+      word = word.trim();
+      if (word.length > 0)
+        this.shortWords_.push(word);
+    }
   }
 
   /** @return {number} Number of patterns added. */
@@ -367,8 +514,10 @@ class AbbrevIso {
   /** @param {LTWAPattern} pattern */
   addPattern(pattern) {
     let p = pattern.pattern;
-    p = p.replace(/^-/, '');
-    p = p.replace(/-$/, '');
+    if (pattern.startDash)
+      p = p.substr(1);
+    if (pattern.endDash)
+      p = p.slice(0, -1);
     p = normalize(p);
     if (!/^[A-Za-z]/u.test(p))
       this.badPatterns_.push(pattern);
@@ -389,29 +538,74 @@ class AbbrevIso {
    * @return {Array<LTWAPattern>}
    */
   getPotentialPatterns(s, pretendDash = false) {
-    // Always add all bad patterns.
-    let result = this.badPatterns_;
+    // Always add all bad patterns. Collect into a Set directly, to remove
+    // duplicates without building an intermediate Array at each position.
+    const result = new Set(this.badPatterns_);
     s = promiscuouslyNormalize(s);
     // Add dict-Patterns/nonprefix-Patterns potentially matching each position,
     // depending on whether this position starts a word or not.
     let isNewWord = true;
     for (let i = 0; i < s.length; i++) {
-      if (!/[a-zA-Z]/.test(s.charAt(i))) {
+      if (s.charAt(i) == ' ') { // `s` has only letters and spaces now.
         isNewWord = true;
         continue;
       }
-      if (isNewWord || pretendDash)
-        result = result.concat(this.dictPatterns_.get(s.substr(i)));
-      result = result.concat(this.nonprefixPatterns_.get(s.substr(i)));
+      if (isNewWord || pretendDash) {
+        for (const pattern of this.dictPatterns_.get(s.substr(i)))
+          result.add(pattern);
+      }
+      for (const pattern of this.nonprefixPatterns_.get(s.substr(i)))
+        result.add(pattern);
       isNewWord = false;
     }
-    // Remove duplicates in result.
-    result.sort();
-    result = result.filter((x, i, res) => !i || x !== res[i-1]);
-    return result;
+    // Sort, to keep the order deterministic.
+    return Array.from(result).sort();
   }
 
 
+  /**
+   * Helper function that prepares an LTWAPattern for `getPatternMatches`.
+   * This doesn't depend on the matched value, so it is done only once for
+   * each pattern (and each value of `pretendDash`).
+   * @param {LTWAPattern} pattern
+   * @param {boolean} pretendDash
+   * @return {{startDash: boolean, endDash: boolean, p: Array<string>,
+   *     replacement: Array<string>, minLength: number}} Whether to treat the
+   *     pattern as having a starting/ending dash, the pattern and replacement
+   *     without dashes (split into characters), and the minimum length of
+   *     a match in `value`.
+   */
+  preparePattern(pattern, pretendDash) {
+    const prepared = this.preparedPatterns_[pretendDash ? 1 : 0];
+    const cached = prepared.get(pattern);
+    if (cached !== undefined)
+      return cached;
+    const startDash = pattern.startDash || pretendDash;
+    const endDash = pattern.endDash || pretendDash;
+    let replacement = pattern.replacement;
+    if (replacement == '–')
+      replacement = '';
+    let p = pattern.pattern;
+    if (startDash) {
+      if (p.startsWith('-'))
+        p = p.substr(1);
+      if (replacement.startsWith('-'))
+        replacement = replacement.substr(1);
+    }
+    if (endDash && p.endsWith('-'))
+      p = p.slice(0, -1);
+    p = Array.from(p);
+    replacement = Array.from(replacement);
+    // A character of `value` matches at most two characters of the pattern
+    // (like 'æ' and 'ae'), except for those equivalent to the empty string.
+    // So no match can start less than `minLength` characters before the end.
+    const minLength = Math.ceil(
+        p.filter((c) => !cEquiv(c, '')).length / 2);
+    const result = {startDash, endDash, p, replacement, minLength};
+    prepared.set(pattern, result);
+    return result;
+  }
+
   /**
    * Returns all matches of one given LTWAPattern in `value`.
    * We only call this function for patterns from `getPotentialPatterns`, so
@@ -442,23 +636,14 @@ class AbbrevIso {
         !pattern.languages.some((x) => languages.includes(x)))
       return [];
 
-    let replacement = pattern.replacement;
-    if (replacement == '–')
-      replacement = '';
-    let p = pattern.pattern;
-    if (pattern.startDash || pretendDash) {
-      p = p.replace(/^-/, '');
-      replacement = replacement.replace(/^-/, '');
-    }
-    if (pattern.endDash || pretendDash)
-      p = p.replace(/-$/, '');
-    replacement = Array.from(replacement);
+    const {startDash, endDash, p, replacement, minLength} =
+        this.preparePattern(pattern, pretendDash);
 
     const result = [];
     let isPreviousCharBoundary = true;
     let i = 0;
-    while (i < value.length) {
-      if (!pattern.startDash && !pretendDash && !isPreviousCharBoundary) {
+    while (i < value.length && value.length - i >= minLength) {
+      if (!startDash && !isPreviousCharBoundary) {
         isPreviousCharBoundary = boundariesRegex.test(value[i]);
         i++;
         continue;
@@ -471,41 +656,43 @@ class AbbrevIso {
       }
       // Now pattern (ignoring dashes) has a match in `value`,
       // starting from i-th position.
+      const [rValue, rPattern] = r;
       let abbr = '';
       let ii = 0;
-      let iend = i + r[0][ii].length;
+      let iend = i + rValue[ii].length;
       let appendix = '';
       for (let j = 0; j < replacement.length; j++) {
-        if (replacement[j] == '.') {
+        const c = replacement[j];
+        if (c == '.') {
           abbr += '.';
           continue;
         }
         // Omit value characters until we get to one
         // also present in the replacement.
-        while (!cEquiv(r[1][ii], replacement[j]) &&
+        while (!cEquiv(rPattern[ii], c) &&
             (j + 1 >= replacement.length ||
-            !cEquiv(r[1][ii], replacement[j] + replacement[j + 1]))) {
+            !cEquiv(rPattern[ii], c + replacement[j + 1]))) {
           ii++;
-          iend += r[0][ii].length;
+          iend += rValue[ii].length;
         }
-        // If r[1][ii] is equivalent to two characters of the replacement,
+        // If rPattern[ii] is equivalent to two characters of the replacement,
         // we have to advance j twice.
-        if (!cEquiv(r[1][ii], replacement[j]))
+        if (!cEquiv(rPattern[ii], c))
           j++;
-        // Now r[1][ii] is also present in the replacement,
+        // Now rPattern[ii] is also present in the replacement,
         // so we copy it to abbr and move on to the next replacement character.
-        abbr += r[0][ii];
+        abbr += rValue[ii];
         ii++;
-        if (ii < r[0].length)
-          iend += r[0][ii].length;
+        if (ii < rValue.length)
+          iend += rValue[ii].length;
       }
       // We omit all remaining characters of the match
       // (with no counterpart in replacement).
-      for (ii++; ii < r[0].length; ii++)
-        iend += r[0][ii].length;
+      for (ii++; ii < rValue.length; ii++)
+        iend += rValue[ii].length;
       // If the pattern had an ending dash,
       // omit all characters until we get a boundary.
-      if (pattern.endDash || pretendDash) {
+      if (endDash) {
         while (iend < value.length &&
                !boundariesRegex.test(value[iend]))
           iend++;
@@ -513,8 +700,8 @@ class AbbrevIso {
       // flection and if we don't have a boundary at iend, discard the pattern.
       } else {
         let valid = true;
-        const ending = new RegExp('^([iaesn\'’]{0,3})' + '($|' + boundariesRegex.source + ')', 'u');
-        const match = value.substr(iend).match(ending);
+        flectionEndingRegex.lastIndex = iend;
+        const match = flectionEndingRegex.exec(value);
         if (match) {
           appendix = match[1];
           iend += appendix.length;
@@ -555,12 +742,12 @@ class AbbrevIso {
   getMatchingPatterns(value, languages = undefined,
       pretendDash = false, patterns = undefined) {
     if (patterns === undefined)
-      patterns = this.getPotentialPatterns(value, pretendDash=pretendDash);
+      patterns = this.getPotentialPatterns(value, pretendDash);
     value = value.normalize('NFC').trim();
-    let matches = [];
+    const matches = [];
     for (const pattern of patterns) {
-      matches = matches.concat(
-          this.getPatternMatches(value, pattern, languages, pretendDash)
+      matches.push(
+          ...this.getPatternMatches(value, pattern, languages, pretendDash)
       );
     }
     const getBeginning = ([i, _iend, _abbr, _pattern, _appendix]) => i;
@@ -583,10 +770,41 @@ class AbbrevIso {
     // is preserved, since it may mean 'Operations Research', but 'B-A ' would
     // lose the 'A').
 
-    // Also try the word with the first letter capitalized.
-    let wordList = shortWords.concat(shortWords.map((s) => s.charAt(0).toUpperCase() + s.substr(1)));
-    for (const word of wordList)
-      s = s.replace(new RegExp(before + word + '\\s', 'gu'), '$1');
+    // First find, in a single scan, which words occur at all. Removing a word
+    // only joins the boundary before it with what followed its whitespace, so
+    // it never creates a new occurrence of a word without boundaries (words
+    // like 'vis-a-vis' can appear, e.g. in 'vis-a-of vis', so they are always
+    // tried). The (sequential) replacements below are only needed for those.
+    // This assumes `before` only matches boundaries, as it does in this file.
+    // The regexes are compiled only the first time a list of words is given.
+    const key = before + '\t' + shortWords.join('|');
+    let regexes = this.shortWordsRegexes_.get(key);
+    if (regexes === undefined) {
+      // Also try the word with the first letter capitalized.
+      const wordList = shortWords.concat(shortWords.map((s) => s.charAt(0).toUpperCase() + s.substr(1)));
+      const hasBoundary = (word) => boundariesRegex.test(word);
+      regexes = {
+        any: new RegExp(before + '(' +
+            wordList.filter((word) => !hasBoundary(word)).join('|') +
+            ')\\s', 'gu'),
+        each: wordList.map((word) =>
+          [word, hasBoundary(word), new RegExp(before + word + '\\s', 'gu')]),
+      };
+      this.shortWordsRegexes_.set(key, regexes);
+    }
+    const present = new Set();
+    regexes.any.lastIndex = 0;
+    let match;
+    while ((match = regexes.any.exec(s)) !== null) {
+      present.add(match[2]);
+      // Rewind, so that the whitespace ending this word can be the boundary
+      // before the next one.
+      regexes.any.lastIndex = match.index + 1;
+    }
+    for (const [word, hasBoundary, regex] of regexes.each) {
+      if (hasBoundary || present.has(word))
+        s = s.replace(regex, '$1');
+    }
     return s;
   }
 
@@ -602,29 +820,28 @@ class AbbrevIso {
    */
   makeAbbreviation(value, languages = undefined, patterns = undefined) {
     let result = value;
-    if (patterns === undefined)
-      patterns = this.getPotentialPatterns(result);
     // Some basic lossless Unicode normalization.
     result = result.normalize('NFC').trim();
     // Punctuation:
-    //     Remove ellipsis.
-    result = result.replace(/\.\.\./ug, '');
-    result = result.replace(/\u2026/ug, '');
-    //     Remove commas.
-    result = result.replace(/,/ug, '');
-    //     Replace periods with commas, unless part of acronyms/initialisms,
-    //     ordinals, or already abbreviated expressions.
-    result = result.replace(/\./ug, ',');
-    //    Return periods in acronyms (repeat for overlaps).
-    result = result.replace(/((^|[A-Z,\.&\-\\\/])\s?[A-Z]),/ug, '$1.');
-    result = result.replace(/((^|[A-Z,\.&\-\\\/])\s?[A-Z]),/ug, '$1.');
-    result = result.replace(/(\s[A-Z]),/ug, '$1.');
-    //    Return periods inside words (like Eco.mont)
-    result = result.replace(/([A-Za-z]),([A-Za-z])/ug, '$1.$2');
-    //    Return periods in ordinals and common expressions.
-    result = result.replace(/([\s\-:,&#()\\\/][0-9]{1,3}),/ug, '$1.');
-    result = result.replace(/((^|\s)(St|Mr|Ms|Mrs|Mx|Dr|Prof|vs)),/ug, '$1.');
-    result = result.replace(/^J,/ug, 'J.');
+    //     Remove ellipsis and commas (in a single pass).
+    result = result.replace(/\.\.\.|\u2026|,/ug, '');
+    //     (Once commas are removed, all of this only concerns titles with
+    //     periods, so skip these regex sweeps for all other titles.)
+    if (result.includes('.')) {
+      //     Replace periods with commas, unless part of acronyms/initialisms,
+      //     ordinals, or already abbreviated expressions.
+      result = result.replace(/\./ug, ',');
+      //    Return periods in acronyms (repeat for overlaps).
+      result = result.replace(/((^|[A-Z,\.&\-\\\/])\s?[A-Z]),/ug, '$1.');
+      result = result.replace(/((^|[A-Z,\.&\-\\\/])\s?[A-Z]),/ug, '$1.');
+      result = result.replace(/(\s[A-Z]),/ug, '$1.');
+      //    Return periods inside words (like Eco.mont)
+      result = result.replace(/([A-Za-z]),([A-Za-z])/ug, '$1.$2');
+      //    Return periods in ordinals and common expressions.
+      result = result.replace(/([\s\-:,&#()\\\/][0-9]{1,3}),/ug, '$1.');
+      result = result.replace(/((^|\s)(St|Mr|Ms|Mrs|Mx|Dr|Prof|vs)),/ug, '$1.');
+      result = result.replace(/^J,/ug, 'J.');
+    }
     //     (Standard says commas and periods for dependent titles can be
     //     preserved, but it doesn't seem to apply any such exceptions in
     //     examples).
@@ -637,43 +854,34 @@ class AbbrevIso {
     // If preceded by [^a-z]
     //result = result.replace(/([^a-z\s])\s*(Series|Serie|Ser|Part|Section|Sect|Sec|Série)[,.]?/ug, '$1');
     // If followed by single letter A-Z, roman numeral, or digit
-    result = result.replace(new RegExp(
-      '(Series|Serie|Ser|Part|Section|Sect|Sec|Série)[,.]?\\s*([A-Z]|[0-9IVXivx]+)'
-      + '(' + boundariesRegex.source + '|$)', 'gu'), '$2$3');
+    result = result.replace(dependentTitleRegex, '$2$3');
     // (Otherwise it may be part of a title, like "Bulletin of the Section of Logic").
 
     // Capitalization is preserved.
     //     (First letter should be capitalized, but we leave that to local
     //     style, check e.g. 'tm-Technisches Messen').
 
-    // This is the same as collation.boundariesRegex, except that we don't
-    // consider +&?' as boundaries (they are part of initialisms like A&A
-    // or words like Baha'i).
-    const boundariesRegex$$1 = /[-\s\u2013\u2014_.,:;!|=*\\/"()#%@$]/;
-    // Articles, as opposed to other short words, are removed from the
-    // beginning also, and are not preserved in single word titles.
-    const articles = ['a', 'an', 'the', 'der', 'die', 'das', 'den', 'dem',
-      'des', 'le', 'la', 'les', 'el', 'il', 'lo', 'los', 'de', 'het',
-      'els', 'ses', 'es', 'gli', 'een', '\'t', '\'n'];
-    result = this.removeShortWords(result, articles, '(^|' + boundariesRegex$$1.source + ')');
+    // Remove articles, also from the beginning (see `articles`).
+    result = this.removeShortWords(result, articles,
+        shortWordBeforeOrStartSource);
     // French articles "l'", "d'" may be followed by whatever.
-    result = result.replace(new RegExp(
-      '((^|' + boundariesRegex.source + '))(l|L|d|D|dell|nell)(\'|’)', 'gu'), '$1');
+    result = result.replace(elidedArticlesRegex, '$1');
 
     // Check if we have a single word after removing all short words.
-    let preResult = this.removeShortWords(result, this.shortWords_, '(^|' + boundariesRegex$$1.source + ')');
-    const r = new RegExp('.' + boundariesRegex.source + '.', 'u');
-    if (!(r.test(preResult)))
+    let preResult = this.removeShortWords(result, this.shortWords_,
+        shortWordBeforeOrStartSource);
+    if (!multipleWordsRegex.test(preResult))
       return result.replace(/\s+/gu, ' ').trim();
 
     // Now the main part: applying LTWA rules.
+    // (Only now look for potential patterns, single word titles don't need them.)
+    if (patterns === undefined)
+      patterns = this.getPotentialPatterns(value);
     // Find and apply patterns, being careful about overlaps.
-    let matches = []; // A list of [i, iend, startDash, endDash, abbr, line].
-    for (const pattern of patterns) {
-      matches = matches.concat(
-          this.getPatternMatches(result, pattern, languages)
-      );
-    }
+    // A list of [i, iend, abbr, pattern, appendix], see `getPatternMatches`.
+    const matches = [];
+    for (const pattern of patterns)
+      matches.push(...this.getPatternMatches(result, pattern, languages));
     
     // Sort by priority: patterns with no starting dashes first,
     // patterns with longer matches first, longer patterns first.
@@ -682,28 +890,39 @@ class AbbrevIso {
       (pattern.startDash ? 100 : 0) + (pattern.endDash ? 3 : 0)
       + appendix.length - (iend - i - appendix.length) - pattern.pattern.length
     );
-    matches.sort((a, b) => (getPriority(a) - getPriority(b)));
+    // (Compute each priority once, not twice per comparison.)
+    const priorities = new Map(matches.map((m) => [m, getPriority(m)]));
+    matches.sort((a, b) => (priorities.get(a) - priorities.get(b)));
     // Resolve overlapping patterns according to priority.
     for (let j = 0; j < matches.length; ++j) {
+      const [jBegin, jEnd] = matches[j];
       for (let k = j + 1; k < matches.length; ++k) {
-        if (matches[j][1] > matches[k][0] && matches[k][1] > matches[j][0])
+        const [kBegin, kEnd] = matches[k];
+        if (jEnd > kBegin && kEnd > jBegin)
           matches.splice(k--, 1); // Remove the later one from matches.
       }
     }
     
-    // Apply matches starting from the later ones.    
+    // Apply matches (which no longer overlap) from left to right, collecting
+    // the pieces of the result to join them once.
     const getBeginning = ([i, _iend, _abbr, _pattern]) => i;
-    matches.sort((a, b) => (getBeginning(b) - getBeginning(a)));
+    matches.sort((a, b) => (getBeginning(a) - getBeginning(b)));
+    const pieces = [];
+    let end = 0;
     for (const [i, iend, abbr, _pattern] of matches) {
       // If we'd abbreviate only one character or less (and add a dot),
       // we don't abbreviate at all.
       if (abbr.length < iend - i) {
-        result = result.substring(0, i) + abbr + result.substr(iend);
+        pieces.push(result.substring(end, i), abbr);
+        end = iend;
       }
     }
+    pieces.push(result.substr(end));
+    result = pieces.join('');
 
     // Other short words are not removed from beginning.
-    result = this.removeShortWords(result, this.shortWords_, '(' + boundariesRegex$$1.source + ')');
+    result = this.removeShortWords(result, this.shortWords_,
+        shortWordBeforeSource);
 
     // Remove superfluous whitepace.
     result = result.replace(/\s+/gu, ' ').trim();
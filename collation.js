@@ -19,6 +19,39 @@ export const boundariesRegex = /[-\s\u2013\u2014_.,:;!|=+*\\/"()&#%@$?]/;
  * @type {RegExp}
  */
 export const newlineRegex = /\r\n|[\n\v\f\r\x85\u2028\u2029]/;
+/**
+ * The same as `boundariesRegex`, but with global matching, for replace().
+ * @type {RegExp}
+ */
+const globalBoundariesRegex = new RegExp(boundariesRegex, 'g');
+
+/**
+ * Replacements for foreign letters that unicode normalization doesn't handle,
+ * see `normalize`.
+ * @type {Object<string, string>}
+ */
+const foreignLetters = {
+  '\u00DF': 'ss', '\u1E9E': 'SS', // scharfes S
+  '\u0111': 'd', '\u0110': 'D', // crossed D
+  '\u00F0': 'd', '\u00D0': 'D', // eth
+  '\u00FE': 'th', '\u00DE': 'TH', // thorn
+  '\u0127': 'h', '\u0126': 'H', // H-bar
+  '\u0142': 'l', '\u0141': 'L', // L with stroke
+  '\u0153': 'oe', '\u0152': 'Oe', // oe ligature
+  '\u00E6': 'ae', '\u00C6': 'Ae', // ae ligature
+  '\u0131': 'i', // dotless i
+  '\u00F8': 'o', '\u00D8': 'O', // o with stroke
+  // Catalan middle dot, double prime (weirdly used for slavic langs),
+  // unicode replacement character (for some mis-utf'd Turkish).
+  '\u00B7': '', '\u02BA': '', '\uFFFD': '',
+};
+/**
+ * Matches any key of `foreignLetters`, so that they are all replaced in one
+ * pass. It has global matching, so only use it in replace().
+ * @type {RegExp}
+ */
+const foreignLettersRegex = new RegExp(
+    '[' + Object.keys(foreignLetters).join('') + ']', 'g');
 
 /**
  * Remove diacritics and try to replace foreign letters with `[a-zA-Z].
@@ -28,20 +61,11 @@ export const newlineRegex = /\r\n|[\n\v\f\r\x85\u2028\u2029]/;
  * @return {string}
  */
 export function normalize(s) {
+  // Nothing to do for plain ASCII, which is the most common case by far.
+  if (/^[\x00-\x7F]*$/.test(s))
+    return s;
   return s
-      .replace(/\u00DF/g, 'ss').replace(/\u1E9E/g, 'SS') // scharfes S
-      .replace(/\u0111/g, 'd').replace(/\u0110/g, 'D') // crossed D
-      .replace(/\u00F0/g, 'd').replace(/\u00D0/g, 'D') // eth
-      .replace(/\u00FE/g, 'th').replace(/\u00DE/g, 'TH') // thorn
-      .replace(/\u0127/g, 'h').replace(/\u0126/g, 'H') // H-bar
-      .replace(/\u0142/g, 'l').replace(/\u0141/g, 'L') // L with stroke
-      .replace(/\u0153/g, 'oe').replace(/\u0152/g, 'Oe') // oe ligature
-      .replace(/\u00E6/g, 'ae').replace(/\u00C6/g, 'Ae') // ae ligature
-      .replace(/\u0131/g, 'i') // dotless i
-      .replace(/\u00F8/g, 'o').replace(/\u00D8/g, 'O') // o with stroke
-  // Catalan middle dot, double prime (weirdly used for slavic langs),
-  // unicode replacement character (for some mis-utf'd Turkish).
-      .replace(/[\u00B7\u02BA\uFFFD]/g, '')
+      .replace(foreignLettersRegex, (c) => foreignLetters[c])
   // Most diacritics are handled by this standard unicode normalization:
   // it decomposes characters into simpler characters plus modifiers,
   // and throws out the modifiers.
@@ -58,10 +82,34 @@ export function normalize(s) {
 export function promiscuouslyNormalize(s) {
   return normalize(s)
       .toLowerCase()
-      .replace(new RegExp(boundariesRegex, 'g'), ' ')
-      .replace(/\s+/gu, ' ').replace(/^\s/gu, '').replace(/\s$/gu, '')
+      .replace(globalBoundariesRegex, ' ')
+      .replace(/\s+/gu, ' ').trim()
       .replace(/[^a-z\ ]/g, ' ')
-      .replace(/kh/g, '').replace(/h/g, '');
+      .replace(/k?h/g, ''); // Remove all 'kh' and then all 'h'.
+}
+
+/**
+ * Maximum number of strings remembered by `fold`.
+ */
+const maxFoldCacheSize = 100000;
+/** @type {Map<string, string>} Cache of `fold` results. */
+const foldCache = new Map();
+
+/**
+ * Returns `normalize(s).toLowerCase()`, memoized: `cEquiv` is called with the
+ * same few single characters (or pairs) over and over.
+ * @param {string} s
+ * @return {string}
+ */
+function fold(s) {
+  let result = foldCache.get(s);
+  if (result === undefined) {
+    result = normalize(s).toLowerCase();
+    if (foldCache.size >= maxFoldCacheSize)
+      foldCache.clear();
+    foldCache.set(s, result);
+  }
+  return result;
 }
 
 /**
@@ -76,7 +124,9 @@ export function cEquiv(s, t) {
   // TODO perhaps we could use instead the following more standard collator?
   //    c = new Intl.Collator('en-u', {usage:'search', sensitivity:'base'});
   //    return c.compare(s,t);
-  return (normalize(s).toLowerCase() == normalize(t).toLowerCase());
+  if (s === t)
+    return true;
+  return (fold(s) == fold(t));
 }
 
 /**
@@ -84,63 +134,78 @@ export function cEquiv(s, t) {
  * E.g., for `s='dæl·lete'`, `t='daell'` the output should be
  * `[['d','æ','l','·','l'] , ['d','ae','l','','l']]`.
  * @param {string} s
- * @param {string} t
+ * @param {(string|Array<string>)} t - Possibly already split into characters
+ *  (by `Array.from`), when matching the same `t` many times.
  * @return {Array<Array<string>>} Pair of equal-length Arrays of consecutive
  *  characters in `s` and `t` that were found to be equivalent.
  */
 export function getCollatingMatch(s, t) {
-  const ss = Array.from(s);
-  const tt = Array.from(t);
+  // Split `s` into characters lazily (like `Array.from`, by code points):
+  // matches usually fail or end within a few characters, while `s` is often
+  // the whole rest of a title.
+  const ss = [];
+  let pos = 0;
+  const splitUpTo = (n) => {
+    while (ss.length < n && pos < s.length) {
+      const length = (s.codePointAt(pos) > 0xFFFF) ? 2 : 1;
+      ss.push(s.substr(pos, length));
+      pos += length;
+    }
+  };
+  const tt = (t instanceof Array) ? t : Array.from(t);
   let i = 0;
   let j = 0;
   const result = [[], []];
 
   while (j < tt.length) {
+    splitUpTo(i + 2);
+    // Read the current characters (and pairs of characters) only once.
+    const c = ss[i];
+    const d = tt[j];
+    const cc = (i + 1 < ss.length) ? c + ss[i+1] : null;
+    const dd = (j + 1 < tt.length) ? d + tt[j+1] : null;
     if (i >= ss.length) {
-      if (cEquiv('', tt[j])) {
+      if (cEquiv('', d)) {
         result[0].push('');
-        result[1].push(tt[j]);
+        result[1].push(d);
         j++;
       } else {
         return false; // `ss` is too short to match `tt`.
       }
-    } else if (i + 1 < ss.length && j + 1 < tt.length
-               && cEquiv(ss[i]+ss[i+1], tt[j]+tt[j+1])) {
-      result[0].push(ss[i]);
-      result[1].push(tt[j]);
+    } else if (cc !== null && dd !== null && cEquiv(cc, dd)) {
+      result[0].push(c);
+      result[1].push(d);
       i++;
       j++;
-    } else if (j + 1 < tt.length
-               && cEquiv(ss[i], tt[j]+tt[j+1]) && !cEquiv(tt[j+1], '')) {
-      if (cEquiv('', tt[j])) {
+    } else if (dd !== null && cEquiv(c, dd) && !cEquiv(tt[j+1], '')) {
+      if (cEquiv('', d)) {
         result[0].push('');
-        result[1].push(tt[j]);
+        result[1].push(d);
         j++;
       } else {
-        result[0].push(ss[i]);
-        result[1].push(tt[j]+tt[j+1]);
+        result[0].push(c);
+        result[1].push(dd);
         i++;
         j += 2;
       }
-    } else if (i + 1 < ss.length
-               && cEquiv(ss[i] + ss[i+1], tt[j]) && !cEquiv(ss[i+1], '')) {
-      if (cEquiv(ss[i], '')) {
-        result[0].push(ss[i]);
+    } else if (cc !== null && cEquiv(cc, d) && !cEquiv(ss[i+1], '')) {
+      if (cEquiv(c, '')) {
+        result[0].push(c);
         result[1].push('');
         i++;
       } else {
-        result[0].push(ss[i]+ss[i+1]);
-        result[1].push(tt[j]);
+        result[0].push(cc);
+        result[1].push(d);
         i += 2;
         j++;
       }
-    } else if (cEquiv(ss[i], tt[j])) {
-      result[0].push(ss[i]);
-      result[1].push(tt[j]);
+    } else if (cEquiv(c, d)) {
+      result[0].push(c);
+      result[1].push(d);
       i++;
       j++;
-    } else if (cEquiv(ss[i], '')) {
-      result[0].push(ss[i]);
+    } else if (cEquiv(c, '')) {
+      result[0].push(c);
       result[1].push('');
       i++;
     } else {
@@ -18,7 +18,8 @@
  *    'eng': 'abbrev using eng, mul (multilanguage) and lat (Latin) rules',
  *    'matchingPatterns': 'LTWA lines whose patterns matched, one per line'
  *  }
- * The speed is roughly 1h for 10000 titles.
+ * The speed is roughly 1h for 10000 titles. The file is saved every
+ * `checkpointInterval` titles, so an interrupted run can simply be resumed.
  */
 'use strict';
 const fs = require('fs');
@@ -29,6 +30,8 @@ if (process.argv.length < 3 || process.argv[2] == 'reset')
   throw new Error('No filename given.');
 const stateFileName = process.argv[2];
 const recomputeAll = process.argv.includes('reset');
+// Number of computed titles after which the state file is saved.
+const checkpointInterval = 200;
 
 // Open JSON 'state' file.
 let state = fs.readFileSync(stateFileName, 'utf8');
@@ -36,39 +39,54 @@ state = JSON.parse(state);
 if (!(state instanceof Object) || !('abbrevs' in state))
   throw new Error('Invalid file: expected object with "abbrevs" key.');
 
+/**
+ * Save JSON 'state' file, writing to a temporary file first, so that an
+ * interrupted write never leaves a truncated state file.
+ */
+function saveState() {
+  fs.writeFileSync(stateFileName + '.tmp', JSON.stringify(state), 'utf8');
+  fs.renameSync(stateFileName + '.tmp', stateFileName);
+}
+
 // Load abbrevISO.
 const ltwa = fs.readFileSync(__dirname + '/LTWA_20170914-modified.csv', 'utf8');
 const shortWords = fs.readFileSync(__dirname + '/shortwords.txt', 'utf8');
 const abbrevIso = new AbbrevIso.AbbrevIso(ltwa, shortWords);
 
 // Compute the data in state['abbrevs'][title] for all titles.
+let nChanged = 0;
 for (let [title, data] of Object.entries(state['abbrevs'])) {
   let changed = false;
   if (typeof(data) !== 'object')
     data = {'all': null, 'eng': null, 'matchingPatterns': null};
+  const t = title.normalize('NFC');
+  // Potential patterns depend only on the title, so they are computed once
+  // and shared by all the calls below.
+  let patterns = undefined;
   for (const lang of Object.keys(data)) {
     if (data[lang] !== null && !recomputeAll)
       continue;
     changed = true;
-    const t = title.normalize('NFC');
+    if (patterns === undefined)
+      patterns = abbrevIso.getPotentialPatterns(t);
     if (lang == 'matchingPatterns') {
-      const matchingPatterns = abbrevIso.getMatchingPatterns(t);
-      let s = '';
-      for (const pattern of matchingPatterns)
-        s += pattern.line + '\n';
-      data[lang] = s;
+      const matchingPatterns =
+          abbrevIso.getMatchingPatterns(t, undefined, false, patterns);
+      data[lang] = matchingPatterns.map((p) => p.line + '\n').join('');
     } else if (lang == 'all') {
-      data[lang] = abbrevIso.makeAbbreviation(t);
+      data[lang] = abbrevIso.makeAbbreviation(t, undefined, patterns);
     } else {
-      const langSet = lang.split(',').concat([, 'mul', 'lat']);
-      data[lang] = abbrevIso.makeAbbreviation(t, langSet);
+      const langSet = lang.split(',').concat(['mul', 'lat']);
+      data[lang] = abbrevIso.makeAbbreviation(t, langSet, patterns);
     }
     if (lang != 'matchingPatterns')
       console.log(`"${t}"\t[${lang}]\t->\t${data[lang]}`);
   }
-  if (changed)
+  if (changed) {
     state['abbrevs'][title] = data;
+    if (++nChanged % checkpointInterval == 0)
+      saveState();
+  }
 }
 
-// Save JSON 'state' file.
-fs.writeFileSync(stateFileName, JSON.stringify(state), 'utf8');
+saveState();
@@ -15,6 +15,27 @@ const ltwa = fs.readFileSync(__dirname + '/LTWA_20170914-modified.csv', 'utf8');
 const shortWords = fs.readFileSync(__dirname + '/shortwords.txt', 'utf8');
 const abbrevIso = new AbbrevIso.AbbrevIso(ltwa, shortWords);
 
+// Recently computed abbreviations (the same titles are often requested
+// repeatedly), keyed by language and title, least recently used first.
+// The language is JSON-encoded in the key, so that e.g. undefined (all
+// languages) and the string 'undefined' (which does filter) stay distinct.
+const maxCacheSize = 10000;
+const cache = new Map();
+
+function getAbbreviation(title, lang) {
+    const key = JSON.stringify([lang === undefined ? null : lang, title]);
+    let abbrev = cache.get(key);
+    if (abbrev === undefined) {
+        abbrev = abbrevIso.makeAbbreviation(title, lang);
+        if (cache.size >= maxCacheSize)
+            cache.delete(cache.keys().next().value);
+    } else {
+        cache.delete(key);
+    }
+    cache.set(key, abbrev);
+    return abbrev;
+}
+
 app.get('/', function(req, res) {
     res.sendFile('server.html', { 'root': __dirname });
 });
@@ -22,10 +43,17 @@ app.get('/', function(req, res) {
 app.get('/a/*', function(req, res) {
     const title = req.params[0];
     let lang = req.query.lang;
+    // Query parsing may also give nested objects, which we don't accept.
+    const isString = (x) => (typeof x === 'string');
+    if (lang !== undefined && !isString(lang) &&
+            !(Array.isArray(lang) && lang.every(isString))) {
+        res.status(400).send('Invalid lang parameter.');
+        return;
+    }
     if (lang === 'all')
         lang = undefined;
     log.info({ title: title, lang: lang, req: req });
-    const abbrev = abbrevIso.makeAbbreviation(title, lang);
+    const abbrev = getAbbreviation(title, lang);
     res.send(abbrev);
 });
 
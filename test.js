@@ -15,16 +15,19 @@ const abbrevIso = new AbbrevIso.AbbrevIso(ltwa, shortWords);
 let t = process.argv.slice(2).join(' ').trim();
 if (t.length) {
     t = t.normalize('NFC');
+    // Look up potential patterns once for both of the following calls.
+    const patterns = abbrevIso.getPotentialPatterns(t);
     console.log('Abbreviation using all language rules:');
-    console.log(abbrevIso.makeAbbreviation(t));
+    console.log(abbrevIso.makeAbbreviation(t, undefined, patterns));
     console.log('Matching patterns:');
-    const matchingPatterns = abbrevIso.getMatchingPatterns(t);
+    const matchingPatterns = abbrevIso.getMatchingPatterns(t, undefined, false, patterns);
     for (const pattern of matchingPatterns)
         console.log(pattern.line);
     console.log('Possible compound patterns:');
     const compoundPatterns = abbrevIso.getMatchingPatterns(t, undefined, true);
+    const matchingSet = new Set(matchingPatterns);
     for (const pattern of compoundPatterns)
-        if (!matchingPatterns.includes(pattern))
+        if (!matchingSet.has(pattern))
             console.log(pattern.line);
 } else {
     let rl = require('readline').createInterface({